@@ -1,15 +1,9 @@
 import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
-
-class Settings:
-    """Application settings"""
-    
-    # Z.AI Configuration
-    ZAI_API_KEY: str = os.getenv("ZAI_API_KEY", "")
-    SYSTEM_PROMPT: str = os.getenv("SYSTEM_PROMPT", """You are Revvi, an AI agent created by Hasin Raiyan. Your purpose is to help make Formula One telemetry accessible and understandable for everyone, regardless of their engineering background.
+DEFAULT_SYSTEM_PROMPT = """You are Revvi, an AI agent created by Hasin Raiyan. Your purpose is to help make Formula One telemetry accessible and understandable for everyone, regardless of their engineering background.
 
 Your specialty is translating the raw data of F1 into human insights. You look at speed traces, throttle and brake overlays, gear shifts, corner-by-corner behavior, and traction usage to tell the story of a lap.
 
@@ -17,11 +11,33 @@ Your role is to be a friendly guide through the telemetry. You help users unders
 
 You ground all your reasoning in standard race engineering logic. When you see patterns like early braking, late apexing, inconsistent throttle application, understeer, or traction issues, you explain them, but only when the data supports it. You always stick to what the telemetry shows you.
 
-You are the voice at the center of a telemetry-driven analysis interface built with FastF1 and custom visualizations. When users select a year, race, session, and driver, you provide clear, helpful explanations alongside the graphs. Your mission is to open up the world of F1 engineering and share the insights that normally stay inside the teams.""")
+You are the voice at the center of a telemetry-driven analysis interface built with FastF1 and custom visualizations. When users select a year, race, session, and driver, you provide clear, helpful explanations alongside the graphs. Your mission is to open up the world of F1 engineering and share the insights that normally stay inside the teams."""
+
+
+def _env(name: str, default: str = ""):
+    """Build a dataclass default factory reading an environment variable"""
+    return field(default_factory=lambda: os.getenv(name, default))
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Application settings"""
+    
+    # Z.AI Configuration
+    ZAI_API_KEY: str = _env("ZAI_API_KEY")
+    SYSTEM_PROMPT: str = _env("SYSTEM_PROMPT", DEFAULT_SYSTEM_PROMPT)
     
     # Server Configuration
-    HOST: str = os.getenv("HOST", "0.0.0.0")
-    PORT: int = int(os.getenv("PORT", "8000"))
+    ENV: str = _env("ENV", "production")
+    HOST: str = _env("HOST", "0.0.0.0")
+    PORT: int = field(default_factory=lambda: int(os.getenv("PORT", "8000")))
+    # 0 means one worker per CPU
+    WORKERS: int = field(default_factory=lambda: int(os.getenv("WEB_CONCURRENCY", "0")))
+    FRONTEND_ORIGINS: tuple = field(default_factory=lambda: tuple(
+        origin.strip()
+        for origin in os.getenv("FRONTEND_ORIGIN", "http://localhost:3000").split(",")
+        if origin.strip()
+    ))
     
     # Model Configuration
     DEFAULT_MODEL: str = "glm-4.6"
@@ -29,10 +45,29 @@ You are the voice at the center of a telemetry-driven analysis interface built w
     DEFAULT_MAX_TOKENS: int = 2048
     
     # Telemetry Configuration
-    FASTF1_CACHE_PATH: str = os.getenv("FASTF1_CACHE_PATH", "./data/fastf1_cache")
-    FASTF1_CACHE_ENABLED: bool = os.getenv("FASTF1_CACHE_ENABLED", "true").lower() == "true"
-    TELEMETRY_MAX_LAPS: int = int(os.getenv("TELEMETRY_MAX_LAPS", "100"))
-    TELEMETRY_TIMEOUT: int = int(os.getenv("TELEMETRY_TIMEOUT", "60"))
+    FASTF1_CACHE_PATH: str = _env("FASTF1_CACHE_PATH", "./data/fastf1_cache")
+    FASTF1_CACHE_ENABLED: bool = field(default_factory=lambda: os.getenv("FASTF1_CACHE_ENABLED", "true").lower() == "true")
+    TELEMETRY_MAX_LAPS: int = field(default_factory=lambda: int(os.getenv("TELEMETRY_MAX_LAPS", "100")))
+    TELEMETRY_TIMEOUT: int = field(default_factory=lambda: int(os.getenv("TELEMETRY_TIMEOUT", "60")))
+    # 0 picks a default based on the number of workers
+    SESSION_CACHE_SIZE: int = field(default_factory=lambda: int(os.getenv("FASTF1_SESSION_CACHE_SIZE", "0")))
+    
+    @property
+    def is_dev(self) -> bool:
+        """Whether the server runs in development mode (auto-reload, single worker)"""
+        return self.ENV.lower() in ("dev", "development")
+    
+    @property
+    def session_cache_size(self) -> int:
+        """
+        Number of loaded FastF1 sessions kept in memory per worker
+        
+        Every worker holds its own cache, so the default is smaller when
+        several workers run.
+        """
+        if self.SESSION_CACHE_SIZE > 0:
+            return self.SESSION_CACHE_SIZE
+        return 16 if self.is_dev or self.WORKERS == 1 else 4
     
     def validate_zai_key(self) -> bool:
         """Validate ZAI API key format"""
@@ -44,5 +79,13 @@ You are the voice at the center of a telemetry-driven analysis interface built w
         
         return True
 
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load environment variables once and return the shared settings"""
+    load_dotenv()
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -1,14 +1,20 @@
 import os
-import json
+import sys
+import time
 import logging
 import asyncio
-from typing import List, Dict, Any, AsyncGenerator
+import functools
+import itertools
+import threading
+from typing import List, Dict, Any, AsyncGenerator, Literal
 from datetime import datetime
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, ConfigDict, Field
 import uvicorn
 
 try:
@@ -16,13 +22,18 @@ try:
 except ImportError:
     raise ImportError("zai-sdk is required. Install with: pip install zai-sdk")
 
-from .config import settings
+from .config import get_settings
 from .telemetry_routes import router as telemetry_router
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
+# Shared system message, built once; treated as read-only
+_SYSTEM_MSG: Dict[str, str] = {"role": "system", "content": sys.intern(settings.SYSTEM_PROMPT)}
+
 # Initialize FastAPI app
 app = FastAPI(
     title="F1 Telemetry API",
@@ -34,14 +45,20 @@ app = FastAPI(
 app.include_router(telemetry_router)
 
 # Add CORS middleware
+# Explicit origins (FRONTEND_ORIGIN, comma-separated) let browsers cache preflights
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=list(settings.FRONTEND_ORIGINS),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
+# Compress large JSON payloads (telemetry arrays compress very well);
+# level 5 gets most of the ratio of level 9 at a fraction of the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Initialize ZAI client
 try:
     settings.validate_zai_key()
@@ -52,14 +69,21 @@ except Exception as e:
     zai_client = None
 
 
+Role = Literal["user", "assistant", "system"]
+
+
 class Message(BaseModel):
     """Message model for chat requests"""
-    role: str = Field(..., description="Message role: 'user', 'assistant', or 'system'")
+    model_config = ConfigDict(extra="ignore")
+    
+    role: Role = Field(..., description="Message role: 'user', 'assistant', or 'system'")
     content: str = Field(..., description="Message content")
 
 
 class ChatRequest(BaseModel):
     """Chat request model"""
+    model_config = ConfigDict(extra="ignore")
+    
     messages: List[Message] = Field(..., description="List of messages in the conversation")
     model: str = Field(default=settings.DEFAULT_MODEL, description="Model to use for completion")
     stream: bool = Field(default=True, description="Whether to stream the response")
@@ -75,109 +99,140 @@ class ChatResponse(BaseModel):
     created: int
 
 
-def validate_messages(messages: List[Message]) -> List[Message]:
-    """Validate and filter messages"""
-    if not messages or len(messages) == 0:
-        raise HTTPException(status_code=400, detail="Messages array is required and cannot be empty")
+def build_api_messages(messages: List[Message]) -> List[Dict[str, str]]:
+    """
+    Convert validated messages to the zai-sdk format in a single pass
     
-    # Filter out invalid messages
-    valid_messages = [
-        msg for msg in messages
-        if msg.role and msg.content and isinstance(msg.content, str)
+    Role and type checks already ran in pydantic-core; this only drops
+    messages with empty content and prepends the system prompt if the
+    conversation does not carry its own.
+    """
+    api_messages = [
+        {"role": msg.role, "content": msg.content}
+        for msg in messages
+        if msg.content
     ]
     
-    if len(valid_messages) == 0:
-        raise HTTPException(status_code=400, detail="No valid messages provided")
+    if not api_messages:
+        raise HTTPException(status_code=400, detail="Messages array is required and cannot be empty")
     
     # Add system prompt if not already present
-    has_system_message = any(msg.role == 'system' for msg in valid_messages)
-    if not has_system_message:
-        system_message = Message(
-            role="system",
-            content=settings.SYSTEM_PROMPT
-        )
-        valid_messages.insert(0, system_message)
+    if not any(msg["role"] == "system" for msg in api_messages):
+        return [_SYSTEM_MSG, *api_messages]
     
-    return valid_messages
+    return api_messages
+
+
+_request_counter = itertools.count(1)
 
 
-async def format_sse_chunk(data: Dict[str, Any]) -> str:
+def new_request_id() -> str:
+    """Generate a cheap, unique request ID for tracing"""
+    return f"req_{time.monotonic_ns():x}_{next(_request_counter):x}"
+
+
+_STREAM_END = object()
+
+
+def _pump_sdk_stream(create_stream, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue, stop: threading.Event) -> None:
+    """Consume a blocking SDK stream in a worker thread, handing chunks to the event loop"""
+    stream = None
+    try:
+        stream = create_stream()
+        for chunk in stream:
+            if stop.is_set():
+                break
+            loop.call_soon_threadsafe(queue.put_nowait, chunk)
+    except Exception as e:
+        loop.call_soon_threadsafe(queue.put_nowait, e)
+    finally:
+        # Release the connection early if the consumer went away
+        close = getattr(stream, "close", None)
+        if stop.is_set() and callable(close):
+            close()
+        loop.call_soon_threadsafe(queue.put_nowait, _STREAM_END)
+
+
+def _log_producer_error(task: asyncio.Task) -> None:
+    """Retrieve and log any error that escaped the stream worker task"""
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error("Stream worker failed: %s", exc)
+
+
+def format_sse_chunk(data: Dict[str, Any]) -> bytes:
     """Format data as Server-Sent Events chunk"""
-    return f"data: {json.dumps(data)}\n\n"
+    return b"data: " + orjson.dumps(data) + b"\n\n"
 
 
-async def stream_chat_completion(messages: List[Message], model: str, temperature: float, max_tokens: int) -> AsyncGenerator[str, None]:
+async def stream_chat_completion(api_messages: List[Dict[str, str]], model: str, temperature: float, max_tokens: int, request_id: str) -> AsyncGenerator[bytes, None]:
     """Stream chat completion using zai-sdk"""
     try:
-        # Convert messages to the format expected by zai-sdk
-        api_messages = [
-            {"role": msg.role, "content": msg.content} 
-            for msg in messages
-        ]
+        logger.info("=== Z.AI SDK Request ===")
+        logger.info("Request ID: %s", request_id)
+        logger.info("Model: %s", model)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Messages: %s", orjson.dumps(api_messages).decode())
         
-        # Generate request ID for tracing
-        request_id = f"req_{datetime.now().timestamp()}_{hash(str(messages)) % 10000}"
-        
-        logger.info(f"=== Z.AI SDK Request ===")
-        logger.info(f"Request ID: {request_id}")
-        logger.info(f"Model: {model}")
-        logger.info(f"Messages: {json.dumps(api_messages, indent=2)}")
-        
-        # For now, let's create a simple mock streaming response
-        # In a real implementation, this would use the actual zai-sdk streaming
-        # But since we're having issues with the SDK streaming, let's create a working version
-        
-        # First, get a non-streaming response
-        response = zai_client.chat.completions.create(
+        # The SDK call and its iterator block on network IO, so the whole
+        # stream is consumed in a worker thread that feeds this queue
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        create_stream = functools.partial(
+            zai_client.chat.completions.create,
             model=model,
             messages=api_messages,
             temperature=temperature,
             max_tokens=max_tokens,
-            stream=False
+            stream=True
         )
+        producer = asyncio.create_task(
+            asyncio.to_thread(_pump_sdk_stream, create_stream, loop, queue, stop)
+        )
+        # Errors are otherwise unobserved if the client disconnects first
+        producer.add_done_callback(_log_producer_error)
         
-        logger.info(f"Got non-streaming response: {response}")
-        
-        # Extract content from response
-        content = ""
-        if hasattr(response, 'choices') and response.choices:
-            content = response.choices[0].message.content if response.choices[0].message else ""
-        elif hasattr(response, 'content'):
-            content = str(response.content)
-        else:
-            content = "Mock response: This is a test response from the Python backend using zai-sdk."
-        
-        logger.info(f"Response content: {content}")
-        
-        # Simulate streaming by breaking content into chunks
-        words = content.split()
-        chunk_size = max(1, len(words) // 10)  # Split into roughly 10 chunks
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is _STREAM_END:
+                    break
+                if isinstance(chunk, Exception):
+                    raise chunk
+                
+                if not getattr(chunk, 'choices', None):
+                    continue
+                
+                delta = chunk.choices[0].delta
+                chunk_content = getattr(delta, 'content', None) if delta else None
+                if not chunk_content:
+                    continue
+                
+                # Create chunk in the expected format
+                chunk_data = {
+                    "choices": [{
+                        "delta": {
+                            "content": chunk_content
+                        }
+                    }],
+                    "model": model,
+                    "created": getattr(chunk, 'created', None) or int(datetime.now().timestamp())
+                }
+                
+                yield format_sse_chunk(chunk_data)
+        finally:
+            # Runs on normal exit and when the client disconnects
+            # (generator closed or cancelled); tells the worker to stop
+            stop.set()
         
-        for i in range(0, len(words), chunk_size):
-            chunk_words = words[i:i + chunk_size]
-            chunk_content = " ".join(chunk_words)
-            if i < len(words) - chunk_size:
-                chunk_content += " "  # Add space between chunks
-            
-            # Create chunk in the expected format
-            chunk_data = {
-                "choices": [{
-                    "delta": {
-                        "content": chunk_content
-                    }
-                }],
-                "model": model,
-                "created": int(datetime.now().timestamp())
-            }
-            
-            logger.info(f"Delta content: {chunk_content}")
-            yield await format_sse_chunk(chunk_data)
-            
-            # Small delay to simulate streaming
-            await asyncio.sleep(0.1)
+        # The worker has queued _STREAM_END and is returning; wait for it
+        await producer
         
         # Send [DONE] marker to match original implementation
-        yield await format_sse_chunk({"data": "[DONE]"})
+        yield format_sse_chunk({"data": "[DONE]"})
         
         logger.info("=== Streaming Complete ===")
         
@@ -189,7 +244,7 @@ async def stream_chat_completion(messages: List[Message], model: str, temperatur
                 "type": "streaming_error"
             }
         }
-        yield await format_sse_chunk(error_data)
+        yield format_sse_chunk(error_data)
 
 
 @app.post("/api/chat")
@@ -202,56 +257,45 @@ async def chat_completions(request: ChatRequest):
         )
     
     try:
-        # Validate messages
-        valid_messages = validate_messages(request.messages)
+        # Convert messages to the format expected by zai-sdk
+        api_messages = build_api_messages(request.messages)
         
-        # Create request payload for logging
-        request_payload = {
-            "model": request.model,
-            "messages": [{"role": msg.role, "content": msg.content} for msg in valid_messages],
-            "stream": request.stream,
-            "temperature": request.temperature,
-            "max_tokens": request.max_tokens,
-            "request_id": f"req_{datetime.now().timestamp()}_{hash(str(valid_messages)) % 10000}"
-        }
+        # Generate request ID for tracing
+        request_id = new_request_id()
         
         logger.info("=== Z.AI API Request ===")
-        logger.info(f"Request Payload: {json.dumps(request_payload, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            # Serializing the whole conversation is only worth it when debugging
+            request_payload = {
+                "model": request.model,
+                "messages": api_messages,
+                "stream": request.stream,
+                "temperature": request.temperature,
+                "max_tokens": request.max_tokens,
+                "request_id": request_id
+            }
+            logger.debug("Request Payload: %s", orjson.dumps(request_payload).decode())
         
         if request.stream:
             # Return streaming response
             return StreamingResponse(
                 stream_chat_completion(
-                    valid_messages, 
+                    api_messages,
                     request.model, 
                     request.temperature, 
-                    request.max_tokens
+                    request.max_tokens,
+                    request_id
                 ),
                 media_type="text/event-stream",
                 headers={
                     "Cache-Control": "no-cache",
                     "Connection": "keep-alive",
-                    "Access-Control-Allow-Origin": "*",
-                    "Access-Control-Allow-Methods": "POST, OPTIONS",
-                    "Access-Control-Allow-Headers": "Content-Type, Authorization"
+                    # Keep GZipMiddleware from buffering the event stream
+                    "Content-Encoding": "identity"
                 }
             )
         else:
             # Non-streaming response (for completeness)
-            # Check if system message exists, if not add it
-            has_system_message = any(msg.role == 'system' for msg in valid_messages)
-            if not has_system_message:
-                system_message = Message(
-                    role="system",
-                    content=settings.SYSTEM_PROMPT
-                )
-                valid_messages.insert(0, system_message)
-            
-            api_messages = [
-                {"role": msg.role, "content": msg.content}
-                for msg in valid_messages
-            ]
-           
             response = zai_client.chat.completions.create(
                 model=request.model,
                 messages=api_messages,
@@ -260,8 +304,8 @@ async def chat_completions(request: ChatRequest):
                 stream=False
             )
            
-            logger.info(f"Z.AI Response Status: 200")
-            logger.info(f"Full response: {response}")
+            logger.info("Z.AI Response Status: 200")
+            logger.debug("Full response: %s", response)
            
             return response
             
@@ -302,10 +346,24 @@ async def shutdown_event():
 
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "app.main:app",
-        host=settings.HOST,
-        port=settings.PORT,
-        reload=True,
-        log_level="info"
-    )
\ No newline at end of file
+    if settings.is_dev:
+        # Auto-reload only works with a single worker
+        uvicorn.run(
+            "app.main:app",
+            host=settings.HOST,
+            port=settings.PORT,
+            reload=True,
+            log_level="info"
+        )
+    else:
+        uvicorn.run(
+            "app.main:app",
+            host=settings.HOST,
+            port=settings.PORT,
+            # uvloop has no Windows build
+            loop="asyncio" if sys.platform == "win32" else "uvloop",
+            http="httptools",
+            workers=settings.WORKERS or os.cpu_count() or 1,
+            access_log=False,
+            log_level="info"
+        )
\ No newline at end of file
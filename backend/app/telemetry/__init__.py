@@ -1,25 +1,50 @@
 """
 Telemetry module for F1 data access using FastF1
+
+The models are imported eagerly (they only need pydantic); the FastF1-backed
+functions are resolved on first attribute access so that importing the
+package does not pull in fastf1, pandas and numpy.
 """
 
-from .session_loader import load_session, get_session_metadata
-from .data_processor import extract_lap_telemetry, compare_drivers_telemetry
+import importlib
+
 from .models import (
     SessionMetadata,
     LapMetadata,
     TelemetryData,
+    TelemetryArrays,
     LapTelemetryResponse,
     ComparisonResponse
 )
 
+# Public function name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'load_session': 'session_loader',
+    'load_session_cached': 'session_loader',
+    'get_session_metadata': 'session_loader',
+    'extract_lap_telemetry': 'data_processor',
+    'compare_drivers_telemetry': 'data_processor',
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, name)
+
+
 __all__ = [
     'load_session',
+    'load_session_cached',
     'get_session_metadata',
     'extract_lap_telemetry',
     'compare_drivers_telemetry',
     'SessionMetadata',
     'LapMetadata',
     'TelemetryData',
+    'TelemetryArrays',
     'LapTelemetryResponse',
     'ComparisonResponse',
 ]
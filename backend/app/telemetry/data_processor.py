@@ -2,13 +2,16 @@
 Telemetry data processor - converts FastF1 data to API-ready format
 """
 
+import asyncio
 import logging
+from datetime import timedelta
 from typing import Optional, Dict, Any
 import pandas as pd
 import numpy as np
 import fastf1
 
-from .models import LapMetadata, TelemetryData
+from .models import LapMetadata, TelemetryArrays
+from .session_loader import get_driver_laps
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +20,7 @@ def extract_lap_telemetry(
     f1_session: fastf1.core.Session,
     driver: str,
     lap_number: int
-) -> tuple[Optional[LapMetadata], Optional[TelemetryData]]:
+) -> tuple[Optional[LapMetadata], Optional[TelemetryArrays]]:
     """
     Extract telemetry data for a specific driver and lap
     
@@ -27,24 +30,25 @@ def extract_lap_telemetry(
         lap_number: Lap number
     
     Returns:
-        Tuple of (LapMetadata, TelemetryData) or (None, None) if not found
+        Tuple of (LapMetadata, telemetry arrays) or (None, None) if not found
     """
     try:
         # Get driver's laps
-        driver_laps = f1_session.laps.pick_driver(driver)
+        driver_laps = get_driver_laps(f1_session, driver)
         
         if driver_laps.empty:
             logger.warning(f"No laps found for driver {driver}")
             return None, None
         
-        # Get specific lap
-        lap = driver_laps[driver_laps['LapNumber'] == lap_number]
-        
-        if lap.empty:
+        # Get specific lap (hashed index lookup)
+        if lap_number not in driver_laps.index:
             logger.warning(f"Lap {lap_number} not found for driver {driver}")
             return None, None
         
-        lap = lap.iloc[0]
+        lap = driver_laps.loc[lap_number]
+        if isinstance(lap, pd.DataFrame):
+            # LapNumber is not guaranteed unique; take the first row, as before
+            lap = lap.iloc[0]
         
         # Extract lap metadata
         lap_meta = _extract_lap_metadata(lap, driver)
@@ -64,115 +68,115 @@ def extract_lap_telemetry(
         raise
 
 
+def _timedelta_seconds(value: Any) -> Optional[float]:
+    """Convert a timedelta to seconds; None for NaT, NaN or missing values"""
+    # pd.Timedelta subclasses datetime.timedelta, pd.NaT does not
+    return value.total_seconds() if isinstance(value, timedelta) else None
+
+
 def _extract_lap_metadata(lap: pd.Series, driver: str) -> LapMetadata:
     """Extract metadata from a lap Series"""
     try:
+        # Plain dict access avoids the pandas indexer on every field
+        data = lap.to_dict()
+        
         # Get lap time
-        lap_time = lap.get('LapTime')
-        lap_time_seconds = None
+        lap_time_seconds = _timedelta_seconds(data.get('LapTime'))
         lap_time_str = None
         
-        if pd.notna(lap_time):
-            if hasattr(lap_time, 'total_seconds'):
-                lap_time_seconds = lap_time.total_seconds()
-                # Format as MM:SS.mmm
-                minutes = int(lap_time_seconds // 60)
-                seconds = lap_time_seconds % 60
-                lap_time_str = f"{minutes}:{seconds:06.3f}"
+        if lap_time_seconds is not None:
+            # Format as MM:SS.mmm
+            minutes = int(lap_time_seconds // 60)
+            seconds = lap_time_seconds % 60
+            lap_time_str = f"{minutes}:{seconds:06.3f}"
         
-        # Get sector times
-        sector_1 = lap.get('Sector1Time')
-        sector_2 = lap.get('Sector2Time')
-        sector_3 = lap.get('Sector3Time')
-        
-        sector_1_time = sector_1.total_seconds() if pd.notna(sector_1) and hasattr(sector_1, 'total_seconds') else None
-        sector_2_time = sector_2.total_seconds() if pd.notna(sector_2) and hasattr(sector_2, 'total_seconds') else None
-        sector_3_time = sector_3.total_seconds() if pd.notna(sector_3) and hasattr(sector_3, 'total_seconds') else None
-        
-        # Get compound
-        compound = lap.get('Compound')
-        compound_str = str(compound) if pd.notna(compound) else None
-        
-        # Check if personal best
-        is_personal_best = bool(lap.get('IsPersonalBest', False))
+        # Get compound (NaN != NaN)
+        compound = data.get('Compound')
+        compound_str = str(compound) if compound is not None and compound == compound else None
         
         return LapMetadata(
-            lap_number=int(lap['LapNumber']),
+            lap_number=int(data['LapNumber']),
             driver=driver,
             lap_time_seconds=lap_time_seconds,
             lap_time_str=lap_time_str,
-            sector_1_time=sector_1_time,
-            sector_2_time=sector_2_time,
-            sector_3_time=sector_3_time,
+            sector_1_time=_timedelta_seconds(data.get('Sector1Time')),
+            sector_2_time=_timedelta_seconds(data.get('Sector2Time')),
+            sector_3_time=_timedelta_seconds(data.get('Sector3Time')),
             compound=compound_str,
-            is_personal_best=is_personal_best
+            is_personal_best=bool(data.get('IsPersonalBest', False))
         )
     except Exception as e:
         logger.error(f"Failed to extract lap metadata: {e}")
         raise
 
 
-def _process_telemetry_dataframe(telemetry_df: pd.DataFrame) -> TelemetryData:
+def _process_telemetry_dataframe(telemetry_df: pd.DataFrame) -> TelemetryArrays:
     """
-    Convert pandas telemetry DataFrame to TelemetryData model
+    Convert pandas telemetry DataFrame to TelemetryArrays
+    
+    The arrays are serialized directly by orjson, so no per-sample Python
+    objects are created. Channels use the smallest dtype that holds their
+    range (float32 for continuous values, int8/uint8 for gear and DRS),
+    which keeps the JSON short. The layout matches the TelemetryData schema.
     
     Args:
         telemetry_df: FastF1 telemetry DataFrame
     
     Returns:
-        TelemetryData model
+        TelemetryArrays dict of NumPy channels
     """
     try:
-        # Helper function to safely convert to list
-        def safe_to_list(column_name: str, dtype=float) -> list:
-            if column_name in telemetry_df.columns:
-                series = telemetry_df[column_name]
-                # Replace NaN with 0 or appropriate default
-                series = series.fillna(0)
-                if dtype == int:
-                    return series.astype(int).tolist()
-                return series.astype(float).tolist()
-            return []
-        
-        # Convert Time to seconds from session start
-        time_data = telemetry_df['Time'] if 'Time' in telemetry_df.columns else telemetry_df.index
-        if hasattr(time_data.iloc[0], 'total_seconds'):
-            time_list = [t.total_seconds() for t in time_data]
+        # Column names probed once; membership checks below hit a native set
+        cols = frozenset(telemetry_df.columns)
+        
+        # Convert a column in one vectorized pass, NaN -> 0
+        def column_array(column_name: str, dtype=np.float32) -> np.ndarray:
+            if column_name not in cols:
+                return np.empty(0, dtype=dtype)
+            return telemetry_df[column_name].to_numpy(dtype=dtype, na_value=0)
+        
+        # Convert Time to seconds from the first sample
+        if 'Time' in cols:
+            td = telemetry_df['Time'].to_numpy(dtype='timedelta64[ns]')
         else:
-            time_list = time_data.tolist()
-        
-        # Normalize time to start from 0
-        if time_list:
-            start_time = time_list[0]
-            time_list = [t - start_time for t in time_list]
-        
-        telemetry = TelemetryData(
-            time=time_list,
-            distance=safe_to_list('Distance', float),
-            speed=safe_to_list('Speed', float),
-            throttle=safe_to_list('Throttle', float),
-            brake=safe_to_list('Brake', float),
-            gear=safe_to_list('nGear', int),
-            rpm=safe_to_list('RPM', float) if 'RPM' in telemetry_df.columns else None,
-            drs=safe_to_list('DRS', int) if 'DRS' in telemetry_df.columns else None
-        )
+            td = telemetry_df.index.to_numpy()
         
-        return telemetry
+        if td.size == 0:
+            time_arr = np.empty(0, dtype=np.float32)
+        elif np.issubdtype(td.dtype, np.timedelta64):
+            ns = td.view(np.int64)
+            time_arr = (np.subtract(ns, ns[0]) * 1e-9).astype(np.float32)
+        else:
+            time_arr = np.subtract(td.astype(np.float64), float(td[0])).astype(np.float32)
+        
+        return TelemetryArrays(
+            time=time_arr,
+            distance=column_array('Distance'),
+            speed=column_array('Speed'),
+            throttle=column_array('Throttle'),
+            brake=column_array('Brake'),
+            gear=column_array('nGear', np.int8),
+            rpm=column_array('RPM') if 'RPM' in cols else None,
+            drs=column_array('DRS', np.uint8) if 'DRS' in cols else None
+        )
         
     except Exception as e:
         logger.error(f"Failed to process telemetry dataframe: {e}")
         raise
 
 
-def compare_drivers_telemetry(
+async def compare_drivers_telemetry(
     f1_session: fastf1.core.Session,
     driver1: str,
     driver2: str,
     lap_number: int
-) -> tuple[Optional[LapMetadata], Optional[TelemetryData], Optional[LapMetadata], Optional[TelemetryData], Optional[float]]:
+) -> tuple[Optional[LapMetadata], Optional[TelemetryArrays], Optional[LapMetadata], Optional[TelemetryArrays], Optional[float]]:
     """
     Compare telemetry between two drivers for the same lap
     
+    Both extractions run concurrently in worker threads, which keeps the
+    event loop responsive while pandas does the heavy lifting.
+    
     Args:
         f1_session: Loaded FastF1 session
         driver1: First driver code
@@ -184,8 +188,10 @@ def compare_drivers_telemetry(
     """
     try:
         # Get telemetry for both drivers
-        lap1_meta, telem1 = extract_lap_telemetry(f1_session, driver1, lap_number)
-        lap2_meta, telem2 = extract_lap_telemetry(f1_session, driver2, lap_number)
+        (lap1_meta, telem1), (lap2_meta, telem2) = await asyncio.gather(
+            asyncio.to_thread(extract_lap_telemetry, f1_session, driver1, lap_number),
+            asyncio.to_thread(extract_lap_telemetry, f1_session, driver2, lap_number)
+        )
         
         # Calculate delta time
         delta_time = None
@@ -211,14 +217,19 @@ def get_fastest_lap(f1_session: fastf1.core.Session, driver: str) -> Optional[in
         Lap number of fastest lap, or None if not found
     """
     try:
-        driver_laps = f1_session.laps.pick_driver(driver)
+        driver_laps = get_driver_laps(f1_session, driver)
         
         if driver_laps.empty:
             return None
         
-        # Find fastest lap
-        fastest = driver_laps.loc[driver_laps['LapTime'].idxmin()]
-        return int(fastest['LapNumber'])
+        # Find fastest lap with one argmin over the int64 nanosecond view
+        lap_times = driver_laps['LapTime'].to_numpy(dtype='timedelta64[ns]')
+        valid = ~np.isnat(lap_times)
+        if not valid.any():
+            return None
+        
+        lap_ns = np.where(valid, lap_times.view(np.int64), np.iinfo(np.int64).max)
+        return int(driver_laps['LapNumber'].to_numpy()[np.argmin(lap_ns)])
         
     except Exception as e:
         logger.warning(f"Failed to get fastest lap for {driver}: {e}")
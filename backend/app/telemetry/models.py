@@ -2,9 +2,12 @@
 Pydantic models for telemetry API
 """
 
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, TypedDict
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class SessionMetadata(BaseModel):
     """Session metadata including drivers and available laps"""
@@ -43,6 +46,23 @@ class TelemetryData(BaseModel):
     drs: Optional[List[int]] = Field(None, description="DRS status (0=closed, 1=open)")
 
 
+class TelemetryArrays(TypedDict):
+    """
+    Telemetry channels as NumPy arrays, as returned by the data processor
+    
+    Serialized directly by orjson without per-element validation; the
+    wire format is described by TelemetryData.
+    """
+    time: "np.ndarray"
+    distance: "np.ndarray"
+    speed: "np.ndarray"
+    throttle: "np.ndarray"
+    brake: "np.ndarray"
+    gear: "np.ndarray"
+    rpm: Optional["np.ndarray"]
+    drs: Optional["np.ndarray"]
+
+
 class LapTelemetryResponse(BaseModel):
     """Response model for lap telemetry endpoint"""
     lap_meta: LapMetadata
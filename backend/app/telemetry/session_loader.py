@@ -3,9 +3,15 @@ FastF1 session loader with caching support
 """
 
 import os
+import asyncio
 import logging
-from typing import Optional, Tuple
+import threading
+from collections import defaultdict
+from typing import Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
 import fastf1
+from cachetools import LRUCache
 
 from ..config import settings
 
@@ -20,6 +26,30 @@ if settings.FASTF1_CACHE_ENABLED:
 else:
     logger.warning("FastF1 cache is disabled - data fetching will be slower")
 
+# Per-driver lap indexes of the sessions in _SESSIONS, keyed by id(session).
+# Entries are added and dropped together with their session.
+_DRIVER_LAPS: Dict[int, Dict[str, fastf1.core.Laps]] = {}
+_DRIVER_LAPS_LOCK = threading.Lock()
+
+
+class _SessionCache(LRUCache):
+    """LRU of loaded sessions that also drops their lap indexes on eviction"""
+    
+    def popitem(self):
+        key, f1_session = super().popitem()
+        with _DRIVER_LAPS_LOCK:
+            _DRIVER_LAPS.pop(id(f1_session), None)
+        return key, f1_session
+
+
+# In-process cache of loaded sessions, keyed by (year, gp, session, load_telemetry)
+SessionKey = Tuple[int, str, str, bool]
+_SESSIONS: LRUCache = _SessionCache(maxsize=settings.session_cache_size)
+# Per-key load locks with the number of requests using each; a lock is
+# dropped when its last user leaves, so failed keys don't accumulate
+_LOCKS: Dict[SessionKey, asyncio.Lock] = {}
+_LOCK_USERS: Dict[SessionKey, int] = defaultdict(int)
+
 
 def load_session(year: int, gp: str, session: str, load_telemetry: bool = True) -> fastf1.core.Session:
     """
@@ -59,6 +89,89 @@ def load_session(year: int, gp: str, session: str, load_telemetry: bool = True)
         raise
 
 
+def _get_cached_session(key: SessionKey) -> Optional[fastf1.core.Session]:
+    """Look up a loaded session, letting a telemetry-loaded one serve lap-only requests"""
+    f1_session = _SESSIONS.get(key)
+    if f1_session is None and not key[3]:
+        f1_session = _SESSIONS.get(key[:3] + (True,))
+    return f1_session
+
+
+async def load_session_cached(year: int, gp: str, session: str, load_telemetry: bool = True) -> fastf1.core.Session:
+    """
+    Load a Formula 1 session, reusing it from the in-process cache if possible
+    
+    Concurrent requests for the same uncached session wait on a per-key lock
+    so the session is only loaded once. Loading runs in a worker thread.
+    
+    Args:
+        year: Season year (e.g., 2024)
+        gp: Grand Prix name (e.g., 'Monaco', 'Monaco Grand Prix')
+        session: Session identifier ('FP1', 'FP2', 'FP3', 'Q', 'S', 'R')
+        load_telemetry: Whether to load telemetry data (default True)
+    
+    Returns:
+        FastF1 Session object
+    """
+    key = (year, gp, session, load_telemetry)
+    
+    f1_session = _get_cached_session(key)
+    if f1_session is not None:
+        return f1_session
+    
+    lock = _LOCKS.get(key)
+    if lock is None:
+        lock = _LOCKS[key] = asyncio.Lock()
+    _LOCK_USERS[key] += 1
+    try:
+        async with lock:
+            # Another request may have loaded it while we waited
+            f1_session = _get_cached_session(key)
+            if f1_session is None:
+                f1_session = await asyncio.to_thread(load_session, year, gp, session, load_telemetry)
+                _SESSIONS[key] = f1_session
+                with _DRIVER_LAPS_LOCK:
+                    _DRIVER_LAPS[id(f1_session)] = {}
+    finally:
+        # Keys come from user input; release the lock even when loading
+        # fails, but only once no other request is waiting on it
+        _LOCK_USERS[key] -= 1
+        if not _LOCK_USERS[key]:
+            del _LOCK_USERS[key]
+            del _LOCKS[key]
+    
+    return f1_session
+
+
+def get_driver_laps(f1_session: fastf1.core.Session, driver: str) -> fastf1.core.Laps:
+    """
+    Get a driver's laps indexed by lap number
+    
+    Results are cached per (session, driver) so repeated lookups skip the
+    pick_driver scan over the full laps table. Only sessions held in the
+    session cache are indexed; their entries are dropped when the session
+    is evicted.
+    
+    Args:
+        f1_session: Loaded FastF1 session
+        driver: Driver code
+    
+    Returns:
+        Driver laps indexed by LapNumber (column kept)
+    """
+    with _DRIVER_LAPS_LOCK:
+        session_laps = _DRIVER_LAPS.get(id(f1_session))
+        driver_laps = session_laps.get(driver) if session_laps is not None else None
+    if driver_laps is not None:
+        return driver_laps
+    
+    driver_laps = f1_session.laps.pick_driver(driver).set_index('LapNumber', drop=False)
+    if session_laps is not None:
+        with _DRIVER_LAPS_LOCK:
+            session_laps[driver] = driver_laps
+    return driver_laps
+
+
 def get_session_metadata(f1_session: fastf1.core.Session) -> dict:
     """
     Extract metadata from a FastF1 session
@@ -70,11 +183,13 @@ def get_session_metadata(f1_session: fastf1.core.Session) -> dict:
         Dictionary with session metadata
     """
     try:
-        # Get unique drivers from laps
-        drivers = sorted(set(f1_session.laps['Driver'].dropna().unique()))
+        # Get unique drivers from laps (np.unique returns them sorted)
+        drivers_arr = f1_session.laps['Driver'].to_numpy()
+        drivers = np.unique(drivers_arr[pd.notna(drivers_arr)]).tolist()
         
         # Get total number of laps
-        total_laps = int(f1_session.laps['LapNumber'].max()) if len(f1_session.laps) > 0 else 0
+        lap_arr = f1_session.laps['LapNumber'].to_numpy()
+        total_laps = int(np.nanmax(lap_arr)) if lap_arr.size else 0
         
         metadata = {
             'year': f1_session.event.year,
@@ -2,16 +2,318 @@
 Speed telemetry extraction for multi-driver comparison
 """
 
+import re
+import zlib
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
 import pandas as pd
 import numpy as np
 import fastf1
+from cachetools import LRUCache, TTLCache
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; NumPy fallbacks are used without it
+    njit = None
 
 logger = logging.getLogger(__name__)
 
 
-def extract_speed_traces(
+# Finished per-driver traces keyed by (session key, driver, lap number).
+# Entries expire after an hour in case a session's data gets refreshed.
+_TRACE_CACHE: TTLCache = TTLCache(maxsize=512, ttl=3600)
+# cachetools caches are not thread-safe; drivers are extracted in threads
+_TRACE_CACHE_LOCK = threading.Lock()
+
+# Circuit corners/rotation per session key (only touched from the event loop)
+_CIRCUIT_CACHE: LRUCache = LRUCache(maxsize=64)
+
+
+# F1 2024 team colors (official F1 website graphics)
+TEAM_COLORS = {
+    'red bull racing': '#3671C6',
+    'ferrari': '#E8002D',
+    'mercedes': '#27F4D2',
+    'mclaren': '#FF8000',
+    'aston martin': '#229971',
+    'alpine': '#FF87BC',
+    'williams': '#64C4FF',
+    'rb': '#6692FF',
+    'kick sauber': '#52E252',
+    'haas': '#B6BABD'
+}
+
+# One alternation with a group per team key; match.lastindex maps to the color
+_TEAM_PATTERN = re.compile('|'.join(f'({re.escape(key)})' for key in TEAM_COLORS))
+_TEAM_COLOR_BY_GROUP = list(TEAM_COLORS.values())
+
+# Fallback colors for unmapped teams, spread by Knuth's multiplicative hash
+# (starting at 1 so no entry is black)
+_FALLBACK_PALETTE = [f'#{((i + 1) * 2654435761) & 0xFFFFFF:06x}' for i in range(256)]
+
+
+# Number of evenly spaced distance samples per returned trace; car data
+# runs at about 4 Hz (roughly 300-450 samples a lap), so this stays close
+# to the source resolution
+TRACE_POINTS = 400
+
+# Telemetry columns extracted per trace, in unpacking order
+TRACE_CHANNELS = ['Distance', 'Speed', 'Throttle', 'Brake']
+
+
+def _resample_and_pack(distance, speed, throttle, brake, grid):
+    """
+    Resample every trace channel onto grid in a single pass
+    
+    grid and distance must be sorted ascending. A monotonic cursor finds
+    the bracketing samples for each grid point, and all channels are
+    written from the same indices and weight: speed and throttle are
+    interpolated linearly, brake (an on/off channel) takes the nearest
+    sample. Weights are clamped to [0, 1] like the NumPy fallback.
+    """
+    n = distance.shape[0]
+    m = grid.shape[0]
+    speed_out = np.empty(m, dtype=np.float32)
+    throttle_out = np.empty(m, dtype=np.uint8)
+    brake_out = np.empty(m, dtype=np.bool_)
+    right = 1
+    for i in range(m):
+        x = grid[i]
+        while right < n - 1 and distance[right] < x:
+            right += 1
+        left = right - 1
+        
+        span = distance[right] - distance[left]
+        weight = (x - distance[left]) / span if span > 0 else 0.0
+        if weight < 0.0:
+            weight = 0.0
+        elif weight > 1.0:
+            weight = 1.0
+        
+        speed_out[i] = speed[left] + (speed[right] - speed[left]) * weight
+        throttle_left = np.float32(throttle[left])
+        throttle_out[i] = np.uint8(np.rint(throttle_left + (np.float32(throttle[right]) - throttle_left) * weight))
+        brake_out[i] = brake[left] if weight < 0.5 else brake[right]
+    
+    return grid, speed_out, throttle_out, brake_out
+
+
+def _resample_numpy(distance, speed, throttle, brake, grid):
+    """NumPy fallback for _resample_and_pack; one searchsorted call serves every channel"""
+    right = np.clip(np.searchsorted(distance, grid), 1, distance.size - 1)
+    left = right - 1
+    span = distance[right] - distance[left]
+    weight = np.divide(grid - distance[left], span, out=np.zeros_like(grid), where=span > 0)
+    np.clip(weight, 0, 1, out=weight)
+    
+    speed_out = speed[left] + (speed[right] - speed[left]) * weight
+    throttle_left = throttle[left].astype(np.float32)
+    throttle_out = np.rint(throttle_left + (throttle[right] - throttle_left) * weight).astype(np.uint8)
+    brake_out = np.where(weight < 0.5, brake[left], brake[right])
+    
+    return grid, speed_out, throttle_out, brake_out
+
+
+if njit is not None:
+    _resample_and_pack = njit(cache=True, fastmath=True)(_resample_and_pack)
+else:
+    _resample_and_pack = _resample_numpy
+
+
+def _resample_trace(
+    distance: np.ndarray,
+    speed: np.ndarray,
+    throttle: np.ndarray,
+    brake: np.ndarray,
+    num_points: int = TRACE_POINTS
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Resample trace channels onto an evenly spaced distance grid
+    
+    Args:
+        distance: Sorted distance samples (at least two)
+        speed: Speed samples
+        throttle: Throttle samples (uint8)
+        brake: Brake samples (bool)
+        num_points: Number of grid points
+    
+    Returns:
+        Tuple of (grid, speed, throttle, brake) arrays of length num_points
+    """
+    grid = np.linspace(0, distance[-1], num_points, dtype=np.float32)
+    return _resample_and_pack(distance, speed, throttle, brake, grid)
+
+
+def _session_key(f1_session: fastf1.core.Session) -> Tuple[int, str, str]:
+    """Stable cache key identifying a session across reloads"""
+    return (f1_session.event.year, f1_session.event.EventName, f1_session.name)
+
+
+def _driver_team_map(f1_session: fastf1.core.Session) -> Dict[str, str]:
+    """Map driver codes to team names in one pass over the session results"""
+    try:
+        results = f1_session.results
+        if results is not None and not results.empty:
+            return dict(zip(results['Abbreviation'], results['TeamName']))
+        
+        # Results can be empty for some sessions; fall back to per-driver info
+        driver_teams = {}
+        for number in f1_session.drivers:
+            info = f1_session.get_driver(number)
+            driver_teams[info.get('Abbreviation')] = info.get('TeamName', 'Unknown')
+        return driver_teams
+    except Exception as e:
+        logger.warning(f"Failed to build driver team map: {e}")
+        return {}
+
+
+def _lap_columns(laps: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Pull the columns used for lap selection out of the full laps table once
+    
+    Every requested driver is then selected with NumPy masks over these
+    arrays instead of a pick_driver call and DataFrame slicing per driver.
+    """
+    lap_ns = laps['LapTime'].to_numpy(dtype='timedelta64[ns]').view(np.int64)
+    valid = laps['LapTime'].notna().to_numpy()
+    return {
+        'driver': laps['Driver'].to_numpy(),
+        'lap_number': laps['LapNumber'].to_numpy(),
+        # Invalid lap times sort last so argmin never picks them
+        'lap_ns': np.where(valid, lap_ns, np.iinfo(np.int64).max),
+        'valid': valid,
+    }
+
+
+def _select_lap(
+    laps: pd.DataFrame,
+    columns: Dict[str, np.ndarray],
+    driver: str,
+    lap_number: Optional[int],
+    lap_type: str
+) -> Optional[pd.Series]:
+    """Pick the requested lap for a driver from the full laps table, or None if unavailable"""
+    driver_mask = columns['driver'] == driver
+    if not driver_mask.any():
+        logger.warning(f"No laps found for driver {driver}")
+        return None
+    
+    if lap_number is not None:
+        mask = driver_mask & (columns['lap_number'] == lap_number)
+        if not mask.any():
+            logger.warning(f"Lap {lap_number} not found for {driver}")
+            return None
+        return laps.iloc[np.argmax(mask)]
+    
+    if lap_type == 'fastest':
+        if not (driver_mask & columns['valid']).any():
+            logger.warning(f"No valid lap times for {driver}")
+            return None
+        fastest = np.argmin(np.where(driver_mask, columns['lap_ns'], np.iinfo(np.int64).max))
+        return laps.iloc[fastest]
+    
+    # Default to first valid lap
+    return laps.iloc[np.argmax(driver_mask)]
+
+
+def _extract_single_trace(f1_session: fastf1.core.Session, driver: str, team: str, lap: pd.Series) -> Optional[Dict[str, Any]]:
+    """
+    Build the speed trace for one driver's lap, reusing a cached result
+    
+    Args:
+        f1_session: Loaded FastF1 session
+        driver: Driver code
+        team: Driver's team name
+        lap: Selected lap row
+    
+    Returns:
+        Trace dictionary, or None if telemetry is unavailable
+    """
+    lap_number = int(lap['LapNumber'])
+    cache_key = (_session_key(f1_session), driver, lap_number)
+    with _TRACE_CACHE_LOCK:
+        trace = _TRACE_CACHE.get(cache_key)
+    if trace is not None:
+        return trace
+    
+    # Get car data only; the traces need no position channels, so the
+    # position merge done by get_telemetry() is skipped. Edge samples are
+    # interpolated at the lap start and end, as get_telemetry() does, so
+    # the trace covers the full lap distance.
+    try:
+        logger.info(f"Getting telemetry for {driver}, lap {lap_number}")
+        telemetry = lap.get_car_data(interpolate_edges=True)
+        logger.info(f"Telemetry retrieved: {len(telemetry)} data points")
+    except Exception as tel_error:
+        logger.error(f"Error getting telemetry for {driver}: {tel_error}")
+        return None
+    
+    if telemetry is None or telemetry.empty:
+        logger.warning(f"No telemetry data for {driver}")
+        return None
+    
+    telemetry = telemetry.add_distance()
+    
+    # Extract speed, distance, throttle, and brake in one float32 block; the
+    # transpose is made contiguous so each channel row serializes with orjson
+    # directly. Throttle (0-100) fits in uint8; brake stays boolean because
+    # the frontend plots true as 100 and passes numbers through unscaled.
+    channels = telemetry[TRACE_CHANNELS].to_numpy(dtype=np.float32)
+    distance, speed, throttle, brake = np.ascontiguousarray(channels.T)
+    throttle = np.nan_to_num(throttle).astype(np.uint8)
+    brake = np.nan_to_num(brake).astype(np.bool_)
+    
+    # Resample onto a fixed distance grid so every trace has the same length
+    if distance.size >= 2:
+        distance, speed, throttle, brake = _resample_trace(distance, speed, throttle, brake)
+    
+    # Get lap metadata
+    lap_time = lap.get('LapTime')
+    lap_time_seconds = lap_time.total_seconds() if pd.notna(lap_time) and hasattr(lap_time, 'total_seconds') else None
+    
+    trace = {
+        'driver': driver,
+        'team': team,
+        'lap_number': lap_number,
+        'lap_time': lap_time_seconds,
+        'distance': distance,
+        'speed': speed,
+        'throttle': throttle,
+        'brake': brake,
+        'color': _get_team_color(team, driver)
+    }
+    with _TRACE_CACHE_LOCK:
+        _TRACE_CACHE[cache_key] = trace
+    return trace
+
+
+def _extract_one(
+    f1_session: fastf1.core.Session,
+    lap_columns: Dict[str, np.ndarray],
+    driver: str,
+    team: str,
+    lap_number: Optional[int],
+    lap_type: str
+) -> Optional[Dict[str, Any]]:
+    """Select the requested lap for one driver and build its trace (None on failure)"""
+    try:
+        # Select lap based on criteria; resolving "fastest" to a lap
+        # number first lets it share cache entries with explicit laps
+        lap = _select_lap(f1_session.laps, lap_columns, driver, lap_number, lap_type)
+        if lap is None:
+            return None
+        
+        return _extract_single_trace(f1_session, driver, team, lap)
+        
+    except Exception as e:
+        logger.error(f"Failed to extract telemetry for {driver}: {e}")
+        return None
+
+
+async def extract_speed_traces(
     f1_session: fastf1.core.Session,
     drivers: List[str],
     lap_number: Optional[int] = None,
@@ -20,6 +322,8 @@ def extract_speed_traces(
     """
     Extract speed telemetry traces for multiple drivers
     
+    Drivers are extracted concurrently in worker threads.
+    
     Args:
         f1_session: Loaded FastF1 session
         drivers: List of driver codes (e.g., ['VER', 'LEC'])
@@ -30,91 +334,22 @@ def extract_speed_traces(
         Dictionary with driver traces and metadata
     """
     try:
-        traces = []
-        max_distance = 0
-        
-        for driver in drivers:
-            try:
-                # Get driver laps
-                driver_laps = f1_session.laps.pick_driver(driver)
-                
-                if driver_laps.empty:
-                    logger.warning(f"No laps found for driver {driver}")
-                    continue
-                
-                
-                # Select lap based on criteria
-                if lap_number is not None:
-                    lap = driver_laps[driver_laps['LapNumber'] == lap_number]
-                    if lap.empty:
-                        logger.warning(f"Lap {lap_number} not found for {driver}")
-                        continue
-                elif lap_type == 'fastest':
-                    # Get fastest lap - filter out invalid times first
-                    valid_laps = driver_laps[driver_laps['LapTime'].notna()]
-                    if valid_laps.empty:
-                        logger.warning(f"No valid lap times for {driver}")
-                        continue
-                    fastest_idx = valid_laps['LapTime'].idxmin()
-                    lap = valid_laps.loc[[fastest_idx]]
-                else:
-                    # Default to first valid lap
-                    lap = driver_laps.iloc[[0]]
-                
-                if lap.empty:
-                    logger.warning(f"No valid lap found for {driver}")
-                    continue
-                
-                lap = lap.iloc[0]
-                
-                # Get telemetry
-                try:
-                    logger.info(f"Getting telemetry for {driver}, lap {lap['LapNumber']}")
-                    telemetry = lap.get_telemetry()
-                    logger.info(f"Telemetry retrieved: {len(telemetry)} data points")
-                except Exception as tel_error:
-                    logger.error(f"Error getting telemetry for {driver}: {tel_error}")
-                    continue
-                
-                if telemetry is None or telemetry.empty:
-                    logger.warning(f"No telemetry data for {driver}")
-                    continue
-                
-                # Sample at 10Hz for performance
-                telemetry = telemetry.add_distance()
-                
-                # Extract speed, distance, throttle, and brake
-                distance = telemetry['Distance'].to_numpy()
-                speed = telemetry['Speed'].to_numpy()
-                throttle = telemetry['Throttle'].to_numpy()
-                brake = telemetry['Brake'].to_numpy()
-                
-                # Track max distance for normalization
-                if len(distance) > 0:
-                    max_distance = max(max_distance, distance[-1])
-                
-                # Get lap metadata
-                lap_time = lap.get('LapTime')
-                lap_time_seconds = lap_time.total_seconds() if pd.notna(lap_time) and hasattr(lap_time, 'total_seconds') else None
-                
-                # Get driver's team for color (simplified - could enhance with team mapping)
-                team = f1_session.get_driver(driver).get('TeamName', 'Unknown') if hasattr(f1_session, 'get_driver') else 'Unknown'
-                
-                traces.append({
-                    'driver': driver,
-                    'team': team,
-                    'lap_number': int(lap['LapNumber']),
-                    'lap_time': lap_time_seconds,
-                    'distance': distance.tolist(),
-                    'speed': speed.tolist(),
-                    'throttle': throttle.tolist(),
-                    'brake': brake.tolist(),
-                    'color': _get_team_color(team, driver)
-                })
-                
-            except Exception as e:
-                logger.error(f"Failed to extract telemetry for {driver}: {e}")
-                continue
+        driver_teams = _driver_team_map(f1_session)
+        lap_columns = _lap_columns(f1_session.laps)
+        
+        results = await asyncio.gather(*[
+            asyncio.to_thread(
+                _extract_one, f1_session, lap_columns, driver, driver_teams.get(driver, 'Unknown'), lap_number, lap_type
+            )
+            for driver in drivers
+        ])
+        traces = [trace for trace in results if trace is not None]
+        
+        # Track max distance for normalization
+        max_distance = max(
+            (float(trace['distance'][-1]) for trace in traces if trace['distance'].size),
+            default=0
+        )
         
         if not traces:
             return {
@@ -128,27 +363,18 @@ def extract_speed_traces(
         if len(traces) == 2:
             delta_data = _calculate_delta(traces[0], traces[1], max_distance)
         
-        # Get circuit info (corners)
-        circuit_info = None
-        try:
-            circuit = f1_session.get_circuit_info()
-            if circuit is not None:
-                circuit_info = {
-                    'corners': circuit.corners[['Number', 'Distance']].to_dict('records'),
-                    'rotation': circuit.rotation
-                }
-        except Exception as e:
-            logger.warning(f"Failed to get circuit info: {e}")
+        session_key = _session_key(f1_session)
+        year, event_name, session_name = session_key
 
         return {
             'traces': traces,
             'max_distance': float(max_distance),
             'delta': delta_data,
-            'circuit_info': circuit_info,
+            'circuit_info': _get_circuit_info(f1_session, session_key),
             'session_info': {
-                'year': f1_session.event.year,
-                'gp': f1_session.event.EventName,
-                'session': f1_session.name
+                'year': year,
+                'gp': event_name,
+                'session': session_name
             }
         }
         
@@ -157,6 +383,186 @@ def extract_speed_traces(
         raise
 
 
+async def stream_speed_traces(
+    f1_session: fastf1.core.Session,
+    drivers: List[str],
+    lap_number: Optional[int] = None,
+    lap_type: str = 'fastest'
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Incremental variant of extract_speed_traces for streamed responses
+    
+    Yields a 'session' event with session and circuit info, then one
+    'trace' event per driver as soon as its extraction finishes, and a
+    final 'summary' event with max_distance and the delta (or an error
+    when no driver had telemetry). The delta uses the requested driver
+    order, as in extract_speed_traces.
+    
+    Args:
+        f1_session: Loaded FastF1 session
+        drivers: List of driver codes (e.g., ['VER', 'LEC'])
+        lap_number: Specific lap number, or None for fastest
+        lap_type: 'fastest' or 'specific' or lap number
+    
+    Yields:
+        Event dictionaries with a 'type' key
+    """
+    session_key = _session_key(f1_session)
+    year, event_name, session_name = session_key
+    yield {
+        'type': 'session',
+        'circuit_info': _get_circuit_info(f1_session, session_key),
+        'session_info': {
+            'year': year,
+            'gp': event_name,
+            'session': session_name
+        }
+    }
+    
+    driver_teams = _driver_team_map(f1_session)
+    lap_columns = _lap_columns(f1_session.laps)
+    
+    async def extract(index: int, driver: str) -> Tuple[int, Optional[Dict[str, Any]]]:
+        trace = await asyncio.to_thread(
+            _extract_one, f1_session, lap_columns, driver, driver_teams.get(driver, 'Unknown'), lap_number, lap_type
+        )
+        return index, trace
+    
+    tasks = [asyncio.ensure_future(extract(index, driver)) for index, driver in enumerate(drivers)]
+    traces: Dict[int, Dict[str, Any]] = {}
+    try:
+        for future in asyncio.as_completed(tasks):
+            index, trace = await future
+            if trace is not None:
+                traces[index] = trace
+                yield {'type': 'trace', 'trace': trace}
+    finally:
+        # The client may disconnect mid-stream; don't leave tasks behind
+        for task in tasks:
+            task.cancel()
+    
+    if not traces:
+        yield {
+            'type': 'summary',
+            'max_distance': 0,
+            'delta': None,
+            'error': 'No telemetry data available for selected drivers'
+        }
+        return
+    
+    ordered = [traces[index] for index in sorted(traces)]
+    max_distance = max(
+        (float(trace['distance'][-1]) for trace in ordered if trace['distance'].size),
+        default=0
+    )
+    
+    delta_data = None
+    if len(ordered) == 2:
+        delta_data = _calculate_delta(ordered[0], ordered[1], max_distance)
+    
+    yield {
+        'type': 'summary',
+        'max_distance': float(max_distance),
+        'delta': delta_data
+    }
+
+
+def _get_circuit_info(f1_session: fastf1.core.Session, session_key: Tuple[int, str, str]) -> Optional[Dict[str, Any]]:
+    """
+    Get corner markers and rotation for the session's circuit
+    
+    Circuit data never changes for a session, so the built dict is cached
+    by session key. Failures are not cached.
+    """
+    circuit_info = _CIRCUIT_CACHE.get(session_key)
+    if circuit_info is not None:
+        return circuit_info
+    
+    try:
+        circuit = f1_session.get_circuit_info()
+        if circuit is None:
+            return None
+        circuit_info = {
+            'corners': circuit.corners[['Number', 'Distance']].to_dict('records'),
+            'rotation': circuit.rotation
+        }
+    except Exception as e:
+        logger.warning(f"Failed to get circuit info: {e}")
+        return None
+    
+    _CIRCUIT_CACHE[session_key] = circuit_info
+    return circuit_info
+
+
+def _delta_kernel(d_common, d1, s1, d2, s2, out):
+    """
+    Write interp(d_common, d1, s1) - interp(d_common, d2, s2) into out
+    
+    d_common, d1 and d2 must be sorted ascending. Each source trace is
+    walked with a monotonic cursor, so every output point costs O(1)
+    instead of a binary search. Values outside a trace are clamped to its
+    end points, matching np.interp. If either trace is empty, out is
+    filled with NaN.
+    """
+    n1 = d1.shape[0]
+    n2 = d2.shape[0]
+    if n1 == 0 or n2 == 0:
+        out[:] = np.nan
+        return
+    
+    j1 = 0
+    j2 = 0
+    for i in range(d_common.shape[0]):
+        x = d_common[i]
+        
+        if x <= d1[0]:
+            v1 = s1[0]
+        elif x >= d1[n1 - 1]:
+            v1 = s1[n1 - 1]
+        else:
+            while d1[j1 + 1] < x:
+                j1 += 1
+            v1 = s1[j1] + (s1[j1 + 1] - s1[j1]) * (x - d1[j1]) / (d1[j1 + 1] - d1[j1])
+        
+        if x <= d2[0]:
+            v2 = s2[0]
+        elif x >= d2[n2 - 1]:
+            v2 = s2[n2 - 1]
+        else:
+            while d2[j2 + 1] < x:
+                j2 += 1
+            v2 = s2[j2] + (s2[j2 + 1] - s2[j2]) * (x - d2[j2]) / (d2[j2 + 1] - d2[j2])
+        
+        out[i] = v1 - v2
+
+
+def _delta_numpy(d_common, d1, s1, d2, s2, out):
+    """NumPy fallback for _delta_kernel; the difference is written straight into out"""
+    if d1.size == 0 or d2.size == 0:
+        out[:] = np.nan
+        return
+    np.subtract(np.interp(d_common, d1, s1), np.interp(d_common, d2, s2), out=out, casting='same_kind')
+
+
+if njit is not None:
+    _delta_kernel = njit(cache=True, fastmath=True)(_delta_kernel)
+else:
+    _delta_kernel = _delta_numpy
+
+
+@lru_cache(maxsize=32)
+def _linspace_grid(max_distance: float, num_points: int = 200) -> np.ndarray:
+    """
+    Shared, read-only float32 distance grid for delta calculations
+    
+    Callers round max_distance to 10 m so laps of the same circuit reuse
+    one grid; points past a trace's end are clamped by the interpolation.
+    """
+    grid = np.linspace(0, max_distance, num_points, dtype=np.float32)
+    grid.flags.writeable = False
+    return grid
+
+
 def _calculate_delta(trace1: Dict, trace2: Dict, max_distance: float) -> Dict[str, Any]:
     """
     Calculate speed delta between two drivers
@@ -172,18 +578,20 @@ def _calculate_delta(trace1: Dict, trace2: Dict, max_distance: float) -> Dict[st
     try:
         # Interpolate both traces to common distance points
         num_points = 200  # Balanced resolution
-        common_distance = np.linspace(0, max_distance, num_points)
-        
-        # Interpolate speed traces
-        speed1_interp = np.interp(common_distance, trace1['distance'], trace1['speed'])
-        speed2_interp = np.interp(common_distance, trace2['distance'], trace2['speed'])
+        common_distance = _linspace_grid(round(max_distance, -1), num_points)
         
-        # Calculate delta (driver1 - driver2)
-        delta_speed = speed1_interp - speed2_interp
+        # Calculate delta (driver1 - driver2), fused into the output buffer
+        delta_speed = np.empty(num_points, dtype=np.float32)
+        _delta_kernel(
+            common_distance,
+            trace1['distance'], trace1['speed'],
+            trace2['distance'], trace2['speed'],
+            delta_speed
+        )
         
         return {
-            'distance': common_distance.tolist(),
-            'delta': delta_speed.tolist(),
+            'distance': common_distance,
+            'delta': delta_speed,
             'driver1': trace1['driver'],
             'driver2': trace2['driver']
         }
@@ -204,25 +612,10 @@ def _get_team_color(team: str, driver: str) -> str:
     Returns:
         Hex color code
     """
-    # F1 2024 team colors
-    # F1 2024 team colors (official F1 website graphics)
-    team_colors = {
-    'red bull racing': '#3671C6',
-    'ferrari': '#E8002D',
-    'mercedes': '#27F4D2',
-    'mclaren': '#FF8000',
-    'aston martin': '#229971',
-    'alpine': '#FF87BC',
-    'williams': '#64C4FF',
-    'rb': '#6692FF',
-    'kick sauber': '#52E252',
-    'haas': '#B6BABD'
-}
-    
-    team_lower = team.lower()
-    for team_key, color in team_colors.items():
-        if team_key in team_lower:
-            return color
+    match = _TEAM_PATTERN.search(team.lower())
+    if match is not None:
+        return _TEAM_COLOR_BY_GROUP[match.lastindex - 1]
     
-    # Fallback: generate color from driver code
-    return f"#{hash(driver) % 0xFFFFFF:06x}"
+    # Fallback: deterministic color from the whole driver code (hash() is
+    # salted per process, crc32 is stable)
+    return _FALLBACK_PALETTE[zlib.crc32(driver.encode()) & 0xFF]
@@ -0,0 +1,101 @@
+"""
+Consistency checks for the speed-trace kernels
+
+The Numba kernels are compiled with fastmath and without bounds checks, so
+they are compared against their NumPy fallbacks on synthetic traces.
+
+Run with: python -m app.telemetry.test_speed_kernels (or pytest)
+"""
+
+import numpy as np
+
+from . import speed_extractor
+
+
+def _python_kernel(kernel):
+    """Return the uncompiled body of a kernel, or None when Numba is not installed"""
+    return getattr(kernel, 'py_func', None)
+
+
+def _synthetic_trace(num_samples: int, seed: int):
+    """Build a sorted trace with repeated distances and a non-zero start"""
+    rng = np.random.default_rng(seed)
+    step = rng.random(num_samples).astype(np.float32) * 20
+    step[::25] = 0  # repeated distance samples
+    distance = np.cumsum(step, dtype=np.float32) + 3
+    speed = (rng.random(num_samples) * 330).astype(np.float32)
+    throttle = rng.integers(0, 101, num_samples).astype(np.uint8)
+    brake = rng.random(num_samples) < 0.3
+    return distance, speed, throttle, brake
+
+
+def test_resample_matches_numpy_fallback():
+    """Compiled and pure-Python resampling agree with the NumPy fallback"""
+    kernels = [speed_extractor._resample_and_pack, _python_kernel(speed_extractor._resample_and_pack)]
+    
+    for seed, num_samples in enumerate((2, 3, 350, 1200)):
+        distance, speed, throttle, brake = _synthetic_trace(num_samples, seed)
+        # Grid starts before the first sample and runs past the last one
+        grid = np.linspace(0, distance[-1] * 1.1, 400, dtype=np.float32)
+        expected = speed_extractor._resample_numpy(distance, speed, throttle, brake, grid)
+        
+        for kernel in kernels:
+            if kernel is None:
+                continue
+            _, speed_out, throttle_out, brake_out = kernel(distance, speed, throttle, brake, grid)
+            
+            assert speed_out.dtype == expected[1].dtype
+            assert throttle_out.dtype == expected[2].dtype
+            assert brake_out.dtype == expected[3].dtype
+            np.testing.assert_allclose(speed_out, expected[1], rtol=1e-4, atol=1e-3)
+            # Rounding may differ by one at exact .5 boundaries
+            assert np.abs(throttle_out.astype(np.int16) - expected[2]).max() <= 1
+            np.testing.assert_array_equal(brake_out, expected[3])
+
+
+
+def test_delta_matches_numpy_fallback():
+    """Compiled and pure-Python delta kernels agree with the NumPy fallback"""
+    kernels = [speed_extractor._delta_kernel, _python_kernel(speed_extractor._delta_kernel)]
+    
+    for seed, (size1, size2) in enumerate(((1, 400), (2, 3), (350, 420), (1200, 900))):
+        d1, s1, _, _ = _synthetic_trace(size1, seed)
+        d2, s2, _, _ = _synthetic_trace(size2, seed + 100)
+        # Common grid runs past the end of both traces
+        d_common = np.linspace(0, max(d1[-1], d2[-1]) * 1.1, 200, dtype=np.float32)
+        expected = np.empty(d_common.size, dtype=np.float32)
+        speed_extractor._delta_numpy(d_common, d1, s1, d2, s2, expected)
+        
+        for kernel in kernels:
+            if kernel is None:
+                continue
+            out = np.empty(d_common.size, dtype=np.float32)
+            kernel(d_common, d1, s1, d2, s2, out)
+            np.testing.assert_allclose(out, expected, rtol=1e-4, atol=1e-3)
+
+
+def test_delta_empty_trace():
+    """An empty trace yields NaN instead of reading out of bounds"""
+    d_common = np.linspace(0, 100, 10, dtype=np.float32)
+    d1, s1, _, _ = _synthetic_trace(50, 0)
+    empty = np.empty(0, dtype=np.float32)
+    kernels = [
+        speed_extractor._delta_kernel,
+        _python_kernel(speed_extractor._delta_kernel),
+        speed_extractor._delta_numpy,
+    ]
+    
+    for kernel in kernels:
+        if kernel is None:
+            continue
+        for args in ((d1, s1, empty, empty), (empty, empty, d1, s1)):
+            out = np.zeros(d_common.size, dtype=np.float32)
+            kernel(d_common, *args, out)
+            assert np.isnan(out).all()
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✓ {name}")
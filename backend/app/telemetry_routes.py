@@ -3,12 +3,14 @@ Telemetry API routes for FastF1 data access
 """
 
 import logging
-from typing import Optional
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, Optional
+import orjson
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 
-from .telemetry.session_loader import load_session, get_session_metadata, get_available_sessions
-from .telemetry.data_processor import extract_lap_telemetry, compare_drivers_telemetry, get_fastest_lap
+# Models only need pydantic; the FastF1-backed modules load lazily via _telemetry_api()
 from .telemetry.models import (
     SessionMetadata,
     LapTelemetryResponse,
@@ -20,6 +22,43 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/telemetry", tags=["telemetry"])
 
 
+@lru_cache(maxsize=1)
+def _telemetry_api() -> SimpleNamespace:
+    """
+    Import the telemetry modules on first use
+    
+    They pull in fastf1, pandas and numpy, which would otherwise be
+    imported by every worker at startup.
+    """
+    from .telemetry import session_loader, data_processor, speed_extractor
+    
+    return SimpleNamespace(
+        load_session_cached=session_loader.load_session_cached,
+        get_session_metadata=session_loader.get_session_metadata,
+        get_available_sessions=session_loader.get_available_sessions,
+        extract_lap_telemetry=data_processor.extract_lap_telemetry,
+        compare_drivers_telemetry=data_processor.compare_drivers_telemetry,
+        get_fastest_lap=data_processor.get_fastest_lap,
+        extract_speed_traces=speed_extractor.extract_speed_traces,
+        stream_speed_traces=speed_extractor.stream_speed_traces,
+    )
+
+
+async def _ndjson_lines(events: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """
+    Encode streamed telemetry events as newline-delimited JSON
+    
+    Errors raised after the response has started are reported as a
+    final 'error' line, since the status code is already sent.
+    """
+    try:
+        async for event in events:
+            yield orjson.dumps(event, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+    except Exception as e:
+        logger.error(f"Failed to stream telemetry: {e}")
+        yield orjson.dumps({"type": "error", "detail": str(e)}) + b"\n"
+
+
 @router.get("/events/{year}")
 async def get_events(year: int):
     """
@@ -32,7 +71,9 @@ async def get_events(year: int):
         List of events with metadata
     """
     try:
-        events = get_available_sessions(year)
+        api = _telemetry_api()
+        
+        events = api.get_available_sessions(year)
         return {"year": year, "events": events}
     except Exception as e:
         logger.error(f"Failed to get events for {year}: {e}")
@@ -60,13 +101,15 @@ async def get_session(
         Session metadata
     """
     try:
+        api = _telemetry_api()
+        
         logger.info(f"Getting session metadata: {year} {gp} {session}")
         
         # Load session (without telemetry for faster metadata retrieval)
-        f1_session = load_session(year, gp, session, load_telemetry=False)
+        f1_session = await api.load_session_cached(year, gp, session, load_telemetry=False)
         
         # Extract metadata
-        metadata = get_session_metadata(f1_session)
+        metadata = api.get_session_metadata(f1_session)
         
         return SessionMetadata(**metadata)
         
@@ -81,7 +124,11 @@ async def get_session(
         )
 
 
-@router.get("/lap", response_model=LapTelemetryResponse)
+@router.get(
+    "/lap",
+    response_class=ORJSONResponse,
+    responses={200: {"model": LapTelemetryResponse}}
+)
 async def get_lap_telemetry(
     year: int = Query(..., description="Season year"),
     gp: str = Query(..., description="Grand Prix name"),
@@ -103,13 +150,15 @@ async def get_lap_telemetry(
         Lap metadata and telemetry data
     """
     try:
+        api = _telemetry_api()
+        
         logger.info(f"Getting lap telemetry: {year} {gp} {session} - {driver} lap {lap}")
         
         # Load session with telemetry
-        f1_session = load_session(year, gp, session, load_telemetry=True)
+        f1_session = await api.load_session_cached(year, gp, session, load_telemetry=True)
         
         # Extract lap telemetry
-        lap_meta, telemetry = extract_lap_telemetry(f1_session, driver, lap)
+        lap_meta, telemetry = api.extract_lap_telemetry(f1_session, driver, lap)
         
         if lap_meta is None:
             raise HTTPException(
@@ -123,10 +172,11 @@ async def get_lap_telemetry(
                 detail=f"Telemetry not available for driver {driver} lap {lap}"
             )
         
-        return LapTelemetryResponse(
-            lap_meta=lap_meta,
-            telemetry=telemetry
-        )
+        # Telemetry arrays are serialized by orjson without revalidation
+        return ORJSONResponse(content={
+            "lap_meta": lap_meta.model_dump(),
+            "telemetry": telemetry
+        })
         
     except HTTPException:
         raise
@@ -138,7 +188,11 @@ async def get_lap_telemetry(
         )
 
 
-@router.get("/compare", response_model=ComparisonResponse)
+@router.get(
+    "/compare",
+    response_class=ORJSONResponse,
+    responses={200: {"model": ComparisonResponse}}
+)
 async def compare_drivers(
     year: int = Query(..., description="Season year"),
     gp: str = Query(..., description="Grand Prix name"),
@@ -162,16 +216,18 @@ async def compare_drivers(
         Comparison data with both drivers' telemetry
     """
     try:
+        api = _telemetry_api()
+        
         logger.info(f"Comparing drivers: {year} {gp} {session} - {driver1} vs {driver2} lap {lap}")
         
         # Load session with telemetry
-        f1_session = load_session(year, gp, session, load_telemetry=True)
+        f1_session = await api.load_session_cached(year, gp, session, load_telemetry=True)
         
         # Get session metadata
-        session_meta = get_session_metadata(f1_session)
+        session_meta = api.get_session_metadata(f1_session)
         
         # Compare drivers
-        lap1_meta, telem1, lap2_meta, telem2, delta_time = compare_drivers_telemetry(
+        lap1_meta, telem1, lap2_meta, telem2, delta_time = await api.compare_drivers_telemetry(
             f1_session, driver1, driver2, lap
         )
         
@@ -187,17 +243,17 @@ async def compare_drivers(
                 detail=f"Telemetry not available for driver {driver2} lap {lap}"
             )
         
-        return ComparisonResponse(
-            session_meta=SessionMetadata(**session_meta),
-            driver1=driver1,
-            driver2=driver2,
-            lap_number=lap,
-            driver1_lap=lap1_meta,
-            driver2_lap=lap2_meta,
-            driver1_telemetry=telem1,
-            driver2_telemetry=telem2,
-            delta_time=delta_time
-        )
+        return ORJSONResponse(content={
+            "session_meta": SessionMetadata(**session_meta).model_dump(),
+            "driver1": driver1,
+            "driver2": driver2,
+            "lap_number": lap,
+            "driver1_lap": lap1_meta.model_dump(),
+            "driver2_lap": lap2_meta.model_dump(),
+            "driver1_telemetry": telem1,
+            "driver2_telemetry": telem2,
+            "delta_time": delta_time
+        })
         
     except HTTPException:
         raise
@@ -209,18 +265,23 @@ async def compare_drivers(
         )
 
 
-@router.get("/speed")
+@router.get("/speed", response_class=ORJSONResponse)
 async def get_speed_telemetry(
     year: int = Query(..., description="Season year"),
     gp: str = Query(..., description="Grand Prix name"),
     session: str = Query(..., description="Session type"),
     drivers: str = Query(..., description="Comma-separated driver codes (e.g., 'VER,LEC')"),
     lap: Optional[int] = Query(None, description="Specific lap number, or None for fastest"),
-    lap_type: str = Query('fastest', description="'fastest' or 'specific'")
+    lap_type: str = Query('fastest', description="'fastest' or 'specific'"),
+    stream: bool = Query(False, description="Stream NDJSON events as each trace is ready")
 ):
     """
     Get speed telemetry traces for multiple drivers
     
+    With stream=true the response is application/x-ndjson: a 'session'
+    line, one 'trace' line per driver as it completes, then a 'summary'
+    line with max_distance and delta.
+    
     Args:
         year: Season year
         gp: Grand Prix name
@@ -228,21 +289,38 @@ async def get_speed_telemetry(
         drivers: Comma-separated driver codes
         lap: Specific lap number (optional)
         lap_type: Type of lap selection
+        stream: Stream traces as NDJSON instead of one JSON document
     
     Returns:
         Speed traces for all drivers with delta data
     """
     try:
-        from .telemetry.speed_extractor import extract_speed_traces
+        api = _telemetry_api()
         
         driver_list = [d.strip().upper() for d in drivers.split(',')]
         logger.info(f"Getting speed telemetry: {year} {gp} {session} - Drivers: {driver_list}, Lap: {lap or lap_type}")
         
         # Load session with telemetry
-        f1_session = load_session(year, gp, session, load_telemetry=True)
+        f1_session = await api.load_session_cached(year, gp, session, load_telemetry=True)
+        
+        if stream:
+            return StreamingResponse(
+                _ndjson_lines(api.stream_speed_traces(
+                    f1_session,
+                    driver_list,
+                    lap_number=lap,
+                    lap_type=lap_type
+                )),
+                media_type="application/x-ndjson",
+                headers={
+                    "Cache-Control": "no-cache",
+                    # Keep GZipMiddleware from buffering the stream
+                    "Content-Encoding": "identity"
+                }
+            )
         
         # Extract speed traces
-        result = extract_speed_traces(
+        result = await api.extract_speed_traces(
             f1_session,
             driver_list,
             lap_number=lap,
@@ -255,7 +333,8 @@ async def get_speed_telemetry(
                 detail=result.get('error', 'No telemetry data available')
             )
         
-        return result
+        # Trace arrays are NumPy; ORJSONResponse serializes them natively
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
@@ -282,13 +361,15 @@ async def get_driver_fastest_lap(year: int, gp: str, session: str, driver: str):
         Fastest lap number and metadata
     """
     try:
+        api = _telemetry_api()
+        
         logger.info(f"Getting fastest lap: {year} {gp} {session} - {driver}")
         
         # Load session
-        f1_session = load_session(year, gp, session, load_telemetry=False)
+        f1_session = await api.load_session_cached(year, gp, session, load_telemetry=False)
         
         # Get fastest lap
-        fastest_lap_num = get_fastest_lap(f1_session, driver)
+        fastest_lap_num = api.get_fastest_lap(f1_session, driver)
         
         if fastest_lap_num is None:
             raise HTTPException(
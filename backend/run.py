@@ -8,6 +8,13 @@ This script starts the FastAPI server with proper configuration.
 import os
 import sys
 import uvicorn
+from dotenv import load_dotenv
+
+# run.py is the local entry point (npm run dev:backend), so default to
+# auto-reload; .env or the shell can still set ENV=production
+load_dotenv()
+os.environ.setdefault("ENV", "dev")
+
 from app.config import settings
 
 def main():
@@ -21,19 +28,37 @@ def main():
         sys.exit(1)
     
     print(f"Starting Z.AI FastAPI Backend...")
+    print(f"Environment: {settings.ENV}")
     print(f"Host: {settings.HOST}")
     print(f"Port: {settings.PORT}")
     print(f"Default Model: {settings.DEFAULT_MODEL}")
     print(f"API Key: {'*' * 10}{settings.ZAI_API_KEY[-10:] if len(settings.ZAI_API_KEY) > 10 else 'INVALID'}")
     
     # Start the server
-    uvicorn.run(
-        "app.main:app",
-        host=settings.HOST,
-        port=settings.PORT,
-        reload=True,
-        log_level="info"
-    )
+    if settings.is_dev:
+        # Auto-reload only works with a single worker
+        uvicorn.run(
+            "app.main:app",
+            host=settings.HOST,
+            port=settings.PORT,
+            reload=True,
+            log_level="info"
+        )
+    else:
+        workers = settings.WORKERS or os.cpu_count() or 1
+        print(f"Workers: {workers}")
+        uvicorn.run(
+            "app.main:app",
+            host=settings.HOST,
+            port=settings.PORT,
+            workers=workers,
+            # uvloop has no Windows build
+            loop="asyncio" if sys.platform == "win32" else "uvloop",
+            http="httptools",
+            reload=False,
+            access_log=False,
+            log_level="info"
+        )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
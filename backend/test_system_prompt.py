@@ -3,9 +3,16 @@
 Test script to verify system prompt functionality
 """
 
-import requests
+import httpx
 import json
 
+# One pooled client reuses connections across requests instead of
+# opening a new TCP connection per call
+client = httpx.Client(
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=10)
+)
+
 def test_system_prompt():
     """Test that the system prompt is correctly added to chat requests"""
     
@@ -26,7 +33,7 @@ def test_system_prompt():
         print(f"Sending request to: {url}")
         print(f"Payload: {json.dumps(payload, indent=2)}")
         
-        response = requests.post(url, json=payload)
+        response = client.post(url, json=payload)
         
         if response.status_code == 200:
             result = response.json()
@@ -54,7 +61,7 @@ def test_system_prompt():
             print(f"\n[FAIL] Request failed with status code: {response.status_code}")
             print(f"Error: {response.text}")
             
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("\n[FAIL] Connection error: Make sure the backend server is running on localhost:8000")
     except Exception as e:
         print(f"\n[FAIL] Error: {str(e)}")